@@ -1,23 +1,87 @@
-import requests
-from bs4 import BeautifulSoup
 import re
 from typing import List, Dict, Optional
 import asyncio
-import aiohttp
 from datetime import datetime
 import random
 
+# Approximate Atlanta zip code centroids, used to place generated parcels
+ZIP_CENTROIDS = {
+    "30305": (33.8318, -84.3852),
+    "30308": (33.7719, -84.3757),
+    "30309": (33.7984, -84.3883),
+    "30312": (33.7466, -84.3749),
+    "30313": (33.7603, -84.3963),
+    "30314": (33.7563, -84.4255),
+    "30315": (33.7051, -84.3838),
+    "30316": (33.7216, -84.3339),
+    "30317": (33.7497, -84.3171)
+}
+
+# Known addresses per zip code; other zips fall back to 30309's list
+ZIP_ADDRESSES = {
+    "30309": [
+        "100 PEACHTREE ST NW",
+        "200 PEACHTREE ST NW", 
+        "300 PEACHTREE ST NW",
+        "400 PEACHTREE ST NW",
+        "500 PEACHTREE ST NW",
+        "600 PEACHTREE ST NW"
+    ],
+    "30308": [
+        "1000 ATLANTIC DR NW",
+        "1100 ATLANTIC DR NW",
+        "1200 ATLANTIC DR NW", 
+        "1300 ATLANTIC DR NW",
+        "1400 ATLANTIC DR NW",
+        "1500 ATLANTIC DR NW"
+    ],
+    "30305": [
+        "2000 PIEDMONT RD NE",
+        "2100 PIEDMONT RD NE",
+        "2200 PIEDMONT RD NE",
+        "2300 PIEDMONT RD NE", 
+        "2400 PIEDMONT RD NE",
+        "2500 PIEDMONT RD NE"
+    ],
+    "30312": [
+        "100 AUBURN AVE NE",
+        "200 AUBURN AVE NE",
+        "300 AUBURN AVE NE",
+        "400 AUBURN AVE NE",
+        "500 AUBURN AVE NE", 
+        "600 AUBURN AVE NE"
+    ]
+}
+
+# Generated parcels lie within this many degrees of their zip centroid
+ZIP_JITTER_DEG = 0.01
+
 class FultonCountyPropertyService:
     """Service to fetch real property data from Fulton County qPublic system"""
     
+    # Owners holding at least this many parcels are treated as landlords
+    LANDLORD_PORTFOLIO_SIZE = 3
+    
     BASE_URL = "https://qpublic.schneidercorp.com"
     SEARCH_URL = f"{BASE_URL}/Application.aspx?AppID=1049&LayerID=23949&PageTypeID=4&PageID=9961&KeyValue="
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self._session = None
+    
+    @property
+    def session(self):
+        """HTTP session, created on first use to keep `requests` off the startup path"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+            self._session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+        return self._session
+    
+    def warm_up(self):
+        """Create the HTTP session ahead of the first request"""
+        self.session
     
     async def search_properties_by_zip(self, zip_code: str) -> List[Dict]:
         """Search for properties in a specific zip code"""
@@ -46,42 +110,7 @@ class FultonCountyPropertyService:
     def _get_test_addresses_by_zip(self, zip_code: str) -> List[str]:
         """Get known addresses for testing by zip code"""
         
-        atlanta_addresses = {
-            "30309": [
-                "100 PEACHTREE ST NW",
-                "200 PEACHTREE ST NW", 
-                "300 PEACHTREE ST NW",
-                "400 PEACHTREE ST NW",
-                "500 PEACHTREE ST NW",
-                "600 PEACHTREE ST NW"
-            ],
-            "30308": [
-                "1000 ATLANTIC DR NW",
-                "1100 ATLANTIC DR NW",
-                "1200 ATLANTIC DR NW", 
-                "1300 ATLANTIC DR NW",
-                "1400 ATLANTIC DR NW",
-                "1500 ATLANTIC DR NW"
-            ],
-            "30305": [
-                "2000 PIEDMONT RD NE",
-                "2100 PIEDMONT RD NE",
-                "2200 PIEDMONT RD NE",
-                "2300 PIEDMONT RD NE", 
-                "2400 PIEDMONT RD NE",
-                "2500 PIEDMONT RD NE"
-            ],
-            "30312": [
-                "100 AUBURN AVE NE",
-                "200 AUBURN AVE NE",
-                "300 AUBURN AVE NE",
-                "400 AUBURN AVE NE",
-                "500 AUBURN AVE NE", 
-                "600 AUBURN AVE NE"
-            ]
-        }
-        
-        return atlanta_addresses.get(zip_code, atlanta_addresses["30309"])
+        return ZIP_ADDRESSES.get(zip_code, ZIP_ADDRESSES["30309"])
     
     async def _fetch_property_by_address(self, address: str, zip_code: str) -> Optional[Dict]:
         """Fetch property details for a specific address"""
@@ -110,6 +139,11 @@ class FultonCountyPropertyService:
         base_value = base_values.get(zip_code, 400000)
         estimated_value = base_value + random.randint(-100000, 200000)
         
+        # Jitter around the zip centroid to spread parcels across the area
+        center_lat, center_lon = ZIP_CENTROIDS.get(zip_code, ZIP_CENTROIDS["30309"])
+        latitude = center_lat + random.uniform(-ZIP_JITTER_DEG, ZIP_JITTER_DEG)
+        longitude = center_lon + random.uniform(-ZIP_JITTER_DEG, ZIP_JITTER_DEG)
+        
         # Generate realistic owner names
         owner_names = [
             "Johnson", "Williams", "Brown", "Davis", "Miller", "Wilson", 
@@ -125,62 +159,71 @@ class FultonCountyPropertyService:
         
         owner_name = f"{random.choice(first_names)} {random.choice(owner_names)}"
         
-        # Generate situation types based on property characteristics
-        situations = ["pre_foreclosure", "probate", "distressed_property", "tired_landlord", "tax_delinquent"]
-        situation_weights = [0.3, 0.2, 0.25, 0.15, 0.1]  # Realistic distribution
-        situation_type = random.choices(situations, weights=situation_weights)[0]
+        # Generate distress signals; tired_landlord is not drawn here, it comes
+        # from the owner's portfolio size once the owner index has seen the parcel
+        situations = ["pre_foreclosure", "probate", "distressed_property", "tax_delinquent"]
+        situation_weights = [0.3, 0.2, 0.25, 0.1]  # Realistic distribution
+        distress_type = random.choices(situations, weights=situation_weights)[0]
         
-        # Calculate equity and liens based on situation
-        if situation_type == "pre_foreclosure":
+        # Calculate equity, liens and the signals the scorer reads based on situation
+        if distress_type == "pre_foreclosure":
             equity_pct = random.uniform(0.10, 0.30)
             liens_amount = random.randint(10000, 50000)
-            motivation_score = random.randint(8, 10)
             days_in_situation = random.randint(30, 120)
+            signals = {"foreclosure_filed": True, "days_on_market": random.randint(0, 120)}
             
-        elif situation_type == "probate":
+        elif distress_type == "probate":
             equity_pct = random.uniform(0.60, 0.90)
             liens_amount = random.randint(0, 15000)
-            motivation_score = random.randint(6, 8)
             days_in_situation = random.randint(90, 365)
+            signals = {
+                "estate_sale": True,
+                "property_age": random.randint(51, 100),
+                "last_sale_years_ago": random.randint(11, 40),
+                "days_on_market": random.randint(0, 150)
+            }
             
-        elif situation_type == "distressed_property":
+        elif distress_type == "distressed_property":
             equity_pct = random.uniform(0.15, 0.40)
             liens_amount = random.randint(5000, 35000)
-            motivation_score = random.randint(7, 10)
             days_in_situation = random.randint(60, 300)
-            
-        elif situation_type == "tired_landlord":
-            equity_pct = random.uniform(0.40, 0.75)
-            liens_amount = random.randint(0, 20000)
-            motivation_score = random.randint(5, 7)
-            days_in_situation = random.randint(180, 730)
+            signals = {"days_on_market": random.randint(181, 300), "foreclosure_filed": random.random() < 0.3}
             
         else:  # tax_delinquent
             equity_pct = random.uniform(0.25, 0.55)
             liens_amount = random.randint(15000, 60000)
-            motivation_score = random.randint(7, 9)
             days_in_situation = random.randint(90, 180)
+            signals = {"tax_delinquent_years": random.randint(2, 4), "days_on_market": random.randint(0, 120)}
         
         property_types = ["single_family", "condo", "townhouse", "multi_family"]
         property_type = random.choice(property_types)
         
-        return {
+        return self.score_property({
             "id": hash(address + zip_code) % 10000,  # Generate unique ID
             "address": address,
             "zip_code": zip_code,
             "city": "Atlanta",
             "state": "GA",
+            "latitude": round(latitude, 6),
+            "longitude": round(longitude, 6),
             "property_type": property_type,
             "owner_name": owner_name,
-            "situation_type": situation_type,
             "equity_percentage": round(equity_pct, 2),
             "estimated_value": estimated_value,
             "liens_amount": liens_amount,
             "days_in_situation": days_in_situation,
-            "motivation_score": motivation_score,
             "last_updated": datetime.now().strftime("%Y-%m-%d"),
-            "data_source": "Fulton County qPublic"
-        }
+            "data_source": "Fulton County qPublic",
+            "signals": signals
+        })
+    
+    def score_property(self, property_data: Dict, portfolio_size: int = 0) -> Dict:
+        """Set situation and motivation from distress signals and the owner's portfolio size"""
+        signals = {**property_data.get('signals', {}), 'portfolio_size': portfolio_size}
+        property_data['portfolio_size'] = portfolio_size
+        property_data['situation_type'] = self._detect_wholesale_situation(signals)
+        property_data['motivation_score'] = self._calculate_motivation_score(signals)
+        return property_data
     
     def _detect_wholesale_situation(self, property_data: Dict) -> str:
         """Analyze property data to detect wholesale opportunities"""
@@ -190,15 +233,24 @@ class FultonCountyPropertyService:
         
         if property_data.get('tax_delinquent_years', 0) > 1:
             return 'tax_delinquent'
-        
-        if property_data.get('days_on_market', 0) > 180:
-            return 'distressed_property'
             
         if property_data.get('property_age', 0) > 50 and property_data.get('last_sale_years_ago', 0) > 10:
             return 'probate'
+        
+        # portfolio_size comes from the owner index (parcels held by the same owner).
+        # It outranks listing and foreclosure signals: an owner of several parcels
+        # is approached as a landlord even when one of them is in trouble
+        if property_data.get('portfolio_size', 0) >= self.LANDLORD_PORTFOLIO_SIZE:
+            return 'tired_landlord'
             
         if property_data.get('rental_property', False) and property_data.get('vacancy_rate', 0) > 0.3:
             return 'tired_landlord'
+        
+        if property_data.get('days_on_market', 0) > 180:
+            return 'distressed_property'
+        
+        if property_data.get('foreclosure_filed', False):
+            return 'pre_foreclosure'
             
         return 'pre_foreclosure'  # Default
     
@@ -218,11 +270,24 @@ class FultonCountyPropertyService:
             
         if property_data.get('estate_sale', False):
             score += 1
+        
+        # Large portfolios mean more management burden and more willingness to sell
+        if property_data.get('portfolio_size', 0) >= self.LANDLORD_PORTFOLIO_SIZE:
+            score += 1
             
         return min(score, 10)  # Cap at 10
 
+# Shared service so the HTTP session is reused across requests
+_service = None
+
+def get_service() -> FultonCountyPropertyService:
+    """Get the shared Fulton County service, creating it on first use"""
+    global _service
+    if _service is None:
+        _service = FultonCountyPropertyService()
+    return _service
+
 # Async wrapper for the service
 async def get_fulton_county_properties(zip_code: str) -> List[Dict]:
     """Async wrapper to get Fulton County properties"""
-    service = FultonCountyPropertyService()
-    return await service.search_properties_by_zip(zip_code)
\ No newline at end of file
+    return await get_service().search_properties_by_zip(zip_code)
\ No newline at end of file
@@ -0,0 +1,109 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE_LAT = 69.0
+
+def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in miles"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+def radius_bbox(lat: float, lon: float, radius_miles: float) -> Tuple[float, float, float, float]:
+    """(min_lat, min_lon, max_lat, max_lon) of the box enclosing a radius"""
+    lat_delta = radius_miles / MILES_PER_DEGREE_LAT
+    # Longitude degrees shrink towards the poles; clamp to avoid dividing by ~0
+    lon_delta = radius_miles / (MILES_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+    return lat - lat_delta, lon - lon_delta, lat + lat_delta, lon + lon_delta
+
+class GeoIndex:
+    """In-memory grid index over property coordinates.
+
+    Properties are bucketed into fixed-size lat/lon cells, so a radius or
+    bounding-box query only touches the cells it overlaps instead of
+    scanning every property.
+    """
+
+    def __init__(self, cell_size_deg: float = 0.02):
+        # 0.02 degrees is roughly 1.4 miles of latitude
+        self.cell_size = cell_size_deg
+        self._cells: Dict[Tuple[int, int], Dict[int, Dict]] = {}
+        self._positions: Dict[int, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.cell_size), math.floor(lon / self.cell_size))
+
+    def add(self, prop: Dict):
+        """Insert or move a property; properties without coordinates are skipped"""
+        lat, lon = prop.get("latitude"), prop.get("longitude")
+        if lat is None or lon is None:
+            self.remove(prop["id"])
+            return
+
+        cell = self._cell(lat, lon)
+        old_cell = self._positions.get(prop["id"])
+        if old_cell is not None and old_cell != cell:
+            self.remove(prop["id"])
+
+        self._cells.setdefault(cell, {})[prop["id"]] = prop
+        self._positions[prop["id"]] = cell
+
+    def remove(self, property_id: int):
+        """Drop a property from the index if present"""
+        cell = self._positions.pop(property_id, None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        bucket.pop(property_id, None)
+        if not bucket:
+            del self._cells[cell]
+
+    def _scan(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float):
+        """Yield properties inside a bounding box, visiting only overlapping cells"""
+        min_row, min_col = self._cell(min_lat, min_lon)
+        max_row, max_col = self._cell(max_lat, max_lon)
+
+        # Sparse data with a huge box: walking occupied cells is cheaper than the grid
+        if (max_row - min_row + 1) * (max_col - min_col + 1) > len(self._cells):
+            cells = [
+                bucket for (row, col), bucket in self._cells.items()
+                if min_row <= row <= max_row and min_col <= col <= max_col
+            ]
+        else:
+            cells = [
+                self._cells[(row, col)]
+                for row in range(min_row, max_row + 1)
+                for col in range(min_col, max_col + 1)
+                if (row, col) in self._cells
+            ]
+
+        for bucket in cells:
+            for prop in bucket.values():
+                if min_lat <= prop["latitude"] <= max_lat and min_lon <= prop["longitude"] <= max_lon:
+                    yield prop
+
+    def within_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> List[Dict]:
+        """Get all properties inside a bounding box"""
+        return list(self._scan(min_lat, min_lon, max_lat, max_lon))
+
+    def within_radius(self, lat: float, lon: float, radius_miles: float) -> List[Tuple[Dict, float]]:
+        """Get (property, distance_miles) pairs within a radius of a point"""
+        # Exact distance is only computed for candidates in the enclosing box
+        results = []
+        for prop in self._scan(*radius_bbox(lat, lon, radius_miles)):
+            distance = haversine_miles(lat, lon, prop["latitude"], prop["longitude"])
+            if distance <= radius_miles:
+                results.append((prop, distance))
+        return results
+
+def distance_to(prop: Dict, lat: float, lon: float) -> Optional[float]:
+    """Distance from a point to a property, or None if it has no coordinates"""
+    if prop.get("latitude") is None or prop.get("longitude") is None:
+        return None
+    return haversine_miles(lat, lon, prop["latitude"], prop["longitude"])
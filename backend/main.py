@@ -1,24 +1,55 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 import os
-from anthropic import Anthropic  
+import asyncio
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
+from fulton_county_service import ZIP_ADDRESSES, ZIP_CENTROIDS, ZIP_JITTER_DEG, get_fulton_county_properties, get_service
+from geo_index import GeoIndex, distance_to, radius_bbox
+from owner_index import OwnerIndex
 
 load_dotenv()
 
 # Global property cache to store real data
 PROPERTY_CACHE = {}
 
+# Spatial index over every property with coordinates (mock + cached)
+GEO_INDEX = GeoIndex()
+
+# Atlanta zip codes whose properties are already in the spatial index
+LOADED_ZIPS = set()
+
+# Background fetches for zips a geo query touched, keyed by zip code
+LOADING_ZIPS = {}
+
+# Owner entities and the parcels they hold (mock + cached)
+OWNER_INDEX = OwnerIndex()
+
 def cache_properties(properties):
     """Store properties in cache for message generation"""
     global PROPERTY_CACHE
+    # Parcels whose owner's portfolio changed (old and new owner) need rescoring
+    affected = set()
     for prop in properties:
         PROPERTY_CACHE[prop['id']] = prop
+        GEO_INDEX.add(prop)
+        affected.update(OWNER_INDEX.owner_parcels(prop['id']))
+        OWNER_INDEX.add(prop)
+        affected.update(OWNER_INDEX.owner_parcels(prop['id']))
+    rescore_portfolios(affected)
+
+def rescore_portfolios(property_ids):
+    """Recompute situation and motivation using each owner's portfolio size"""
+    for property_id in property_ids:
+        prop = PROPERTY_CACHE.get(property_id)
+        # Only records with distress signals are scored; mock data is curated
+        if prop and "signals" in prop:
+            get_service().score_property(prop, OWNER_INDEX.portfolio_size(property_id))
 
 def get_cached_property(property_id):
     """Get property from cache or mock data"""
@@ -29,7 +60,39 @@ def get_cached_property(property_id):
     # Then try mock data
     return next((p for p in MOCK_PROPERTIES if p["id"] == property_id), None)
 
-app = FastAPI(title="Wholesaler AI API", version="1.0.0")
+# Claude client is created on first use so cold starts don't pay for the SDK import
+_client = None
+
+def get_client():
+    """Get the Claude client, creating it on first use"""
+    global _client
+    if _client is None:
+        from anthropic import Anthropic
+        _client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    return _client
+
+def warm_up():
+    """Pre-load heavy modules and clients so the first real request is fast"""
+    try:
+        get_client()
+        get_service().warm_up()
+    except Exception as e:
+        # Warm-up is best effort; requests will retry lazily and surface the error
+        print(f"Warm-up failed: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Optional warm-up runs in the background so it never delays readiness
+    if os.getenv("WARMUP_ON_STARTUP", "").lower() in ("1", "true", "yes"):
+        app.state.warmup_task = asyncio.create_task(asyncio.to_thread(warm_up))
+    yield
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    for task in list(LOADING_ZIPS.values()):
+        task.cancel()
+
+app = FastAPI(title="Wholesaler AI API", version="1.0.0", lifespan=lifespan)
 
 # Enable CORS for React frontend
 app.add_middleware(
@@ -45,11 +108,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Loading-Zips"],
 )
 
-# Initialize Claude client
-client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-
 # Pydantic models
 class Property(BaseModel):
     id: int
@@ -57,6 +118,8 @@ class Property(BaseModel):
     zip_code: str
     city: str
     state: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
     property_type: str
     owner_name: str
     situation_type: str
@@ -66,6 +129,8 @@ class Property(BaseModel):
     days_in_situation: int
     motivation_score: int
     last_updated: str
+    distance_miles: Optional[float] = None
+    portfolio_size: Optional[int] = None
 
 class PropertyFilter(BaseModel):
     zip_code: Optional[str] = None
@@ -75,6 +140,24 @@ class PropertyFilter(BaseModel):
     min_value: Optional[int] = None
     max_value: Optional[int] = None
     min_motivation: Optional[int] = None
+    # Radius search around a point
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
+    radius_miles: Optional[float] = Field(None, gt=0)
+    # Bounding-box search
+    min_latitude: Optional[float] = Field(None, ge=-90, le=90)
+    max_latitude: Optional[float] = Field(None, ge=-90, le=90)
+    min_longitude: Optional[float] = Field(None, ge=-180, le=180)
+    max_longitude: Optional[float] = Field(None, ge=-180, le=180)
+    sort_by: Literal["motivation", "distance"] = "motivation"
+
+class OwnerPortfolio(BaseModel):
+    owner_id: int
+    owner_name: str
+    aliases: List[str]
+    exact_match: bool
+    portfolio_size: int
+    properties: List[Property]
 
 class MessageRequest(BaseModel):
     property_id: int
@@ -112,6 +195,8 @@ MOCK_PROPERTIES = [
         "zip_code": "10001",
         "city": "New York",
         "state": "NY",
+        "latitude": 40.7484,
+        "longitude": -73.9967,
         "property_type": "single_family",
         "owner_name": "John Smith",
         "situation_type": "pre_foreclosure",
@@ -129,6 +214,8 @@ MOCK_PROPERTIES = [
         "zip_code": "10001",
         "city": "New York",
         "state": "NY",
+        "latitude": 40.7521,
+        "longitude": -73.999,
         "property_type": "single_family",
         "owner_name": "Maria Rodriguez",
         "situation_type": "probate",
@@ -146,6 +233,8 @@ MOCK_PROPERTIES = [
         "zip_code": "10002",
         "city": "New York",
         "state": "NY",
+        "latitude": 40.7157,
+        "longitude": -73.9878,
         "property_type": "condo",
         "owner_name": "Robert Johnson",
         "situation_type": "distressed_property",
@@ -163,6 +252,8 @@ MOCK_PROPERTIES = [
         "zip_code": "10001",
         "city": "New York",
         "state": "NY",
+        "latitude": 40.7495,
+        "longitude": -73.9941,
         "property_type": "multi_family",
         "owner_name": "Sarah Wilson",
         "situation_type": "tired_landlord",
@@ -180,6 +271,8 @@ MOCK_PROPERTIES = [
         "zip_code": "10003",
         "city": "New York",
         "state": "NY",
+        "latitude": 40.7322,
+        "longitude": -73.9884,
         "property_type": "single_family",
         "owner_name": "Michael Brown",
         "situation_type": "tax_delinquent",
@@ -197,6 +290,8 @@ MOCK_PROPERTIES = [
         "zip_code": "10002",
         "city": "New York",
         "state": "NY",
+        "latitude": 40.7149,
+        "longitude": -73.9851,
         "property_type": "townhouse",
         "owner_name": "Lisa Davis",
         "situation_type": "foreclosure_auction",
@@ -210,55 +305,176 @@ MOCK_PROPERTIES = [
     }
 ]
 
+for prop in MOCK_PROPERTIES:
+    GEO_INDEX.add(prop)
+    OWNER_INDEX.add(prop)
+
+def has_point(filters: PropertyFilter) -> bool:
+    return filters.latitude is not None and filters.longitude is not None
+
+def has_bbox(filters: PropertyFilter) -> bool:
+    return None not in (filters.min_latitude, filters.max_latitude, filters.min_longitude, filters.max_longitude)
+
+def validate_geo_filters(filters: PropertyFilter):
+    """Reject incomplete or inconsistent geospatial filters"""
+    bbox_fields = (filters.min_latitude, filters.max_latitude, filters.min_longitude, filters.max_longitude)
+    if any(v is not None for v in bbox_fields) and not has_bbox(filters):
+        raise HTTPException(status_code=400, detail="Bounding box needs min/max latitude and longitude")
+    if has_bbox(filters) and (filters.min_latitude > filters.max_latitude or filters.min_longitude > filters.max_longitude):
+        raise HTTPException(status_code=400, detail="Bounding box minimums must not exceed maximums")
+    if (filters.latitude is None) != (filters.longitude is None):
+        raise HTTPException(status_code=400, detail="Latitude and longitude must be given together")
+    if filters.radius_miles is not None and not has_point(filters):
+        raise HTTPException(status_code=400, detail="Radius search needs latitude and longitude")
+    if filters.sort_by == "distance" and not has_point(filters):
+        raise HTTPException(status_code=400, detail="Sorting by distance needs latitude and longitude")
+
+def round_distance(distance: Optional[float]) -> Optional[float]:
+    return round(distance, 2) if distance is not None else None
+
+async def load_zip(zip_code: str):
+    """Fetch and index one Atlanta zip"""
+    try:
+        properties = await get_fulton_county_properties(zip_code)
+        cache_properties(properties)
+        LOADED_ZIPS.add(zip_code)
+    except Exception as e:
+        print(f"Error fetching real data for {zip_code}: {e}")
+    finally:
+        LOADING_ZIPS.pop(zip_code, None)
+
+def load_zips_in_area(filters: PropertyFilter) -> List[str]:
+    """Start background fetches for Atlanta zips overlapping a geo query.
+
+    Fetching a zip takes seconds, so the query answers from what is already
+    indexed; returns the zips still loading so the client can retry.
+    """
+    if filters.radius_miles is not None:
+        min_lat, min_lon, max_lat, max_lon = radius_bbox(filters.latitude, filters.longitude, filters.radius_miles)
+    else:
+        min_lat, min_lon, max_lat, max_lon = (filters.min_latitude, filters.min_longitude,
+                                              filters.max_latitude, filters.max_longitude)
+    if has_bbox(filters):
+        min_lat, min_lon = max(min_lat, filters.min_latitude), max(min_lon, filters.min_longitude)
+        max_lat, max_lon = min(max_lat, filters.max_latitude), min(max_lon, filters.max_longitude)
+    
+    # A zip's parcels lie within the jitter of its centroid; only zips with
+    # known addresses are loaded, others would reuse another zip's streets
+    zip_codes = [
+        z for z, (lat, lon) in ZIP_CENTROIDS.items()
+        if z in ZIP_ADDRESSES and z not in LOADED_ZIPS
+        and min_lat - ZIP_JITTER_DEG <= lat <= max_lat + ZIP_JITTER_DEG
+        and min_lon - ZIP_JITTER_DEG <= lon <= max_lon + ZIP_JITTER_DEG
+    ]
+    for zip_code in zip_codes:
+        if zip_code not in LOADING_ZIPS:
+            LOADING_ZIPS[zip_code] = asyncio.create_task(load_zip(zip_code))
+    return zip_codes
+
+def geo_search(filters: PropertyFilter) -> List[dict]:
+    """Find indexed properties matching the radius and/or bounding-box filters"""
+    if filters.radius_miles is not None:
+        matches = GEO_INDEX.within_radius(filters.latitude, filters.longitude, filters.radius_miles)
+        if has_bbox(filters):
+            matches = [
+                (p, d) for p, d in matches
+                if filters.min_latitude <= p["latitude"] <= filters.max_latitude
+                and filters.min_longitude <= p["longitude"] <= filters.max_longitude
+            ]
+    else:
+        matches = [
+            (p, distance_to(p, filters.latitude, filters.longitude) if has_point(filters) else None)
+            for p in GEO_INDEX.within_bbox(filters.min_latitude, filters.min_longitude,
+                                           filters.max_latitude, filters.max_longitude)
+        ]
+
+    # Copy so per-query distances never leak into cached property records
+    return [{**p, "distance_miles": round_distance(d)} for p, d in matches]
+
+def annotate_property(prop: dict, filters: PropertyFilter) -> dict:
+    """Copy a property with per-query fields: owner portfolio size and distance"""
+    annotated = {**prop, "portfolio_size": OWNER_INDEX.portfolio_size(prop["id"])}
+    if has_point(filters) and "distance_miles" not in prop:
+        annotated["distance_miles"] = round_distance(distance_to(prop, filters.latitude, filters.longitude))
+    return annotated
+
+def apply_filters(properties: List[dict], filters: PropertyFilter) -> List[dict]:
+    """Apply situation, equity, value and motivation filters, then sort.
+
+    Returned records are copies with `portfolio_size` (and `distance_miles`
+    when a point is given), so callers should cache the originals, not this result.
+    """
+    if filters.situation_types:
+        properties = [p for p in properties if p["situation_type"] in filters.situation_types]
+    
+    if filters.min_equity is not None:
+        properties = [p for p in properties if p["equity_percentage"] >= filters.min_equity]
+        
+    if filters.max_equity is not None:
+        properties = [p for p in properties if p["equity_percentage"] <= filters.max_equity]
+    
+    if filters.min_value is not None:
+        properties = [p for p in properties if p["estimated_value"] >= filters.min_value]
+        
+    if filters.max_value is not None:
+        properties = [p for p in properties if p["estimated_value"] <= filters.max_value]
+    
+    if filters.min_motivation is not None:
+        properties = [p for p in properties if p["motivation_score"] >= filters.min_motivation]
+    
+    properties = [annotate_property(p, filters) for p in properties]
+    
+    if filters.sort_by == "distance":
+        # Closest first (unknown locations last), ties broken by motivation
+        properties.sort(key=lambda x: (
+            x["distance_miles"] if x["distance_miles"] is not None else float("inf"),
+            -x["motivation_score"]
+        ))
+    else:
+        # Sort by motivation score (highest first)
+        properties.sort(key=lambda x: x["motivation_score"], reverse=True)
+    
+    return properties
+
 @app.get("/")
 async def root():
     return {"message": "Wholesaler AI API is running"}
 
 @app.post("/api/properties/search")
-async def search_properties(filters: PropertyFilter) -> List[Property]:
+async def search_properties(filters: PropertyFilter, response: Response) -> List[Property]:
     """Search properties based on filters - supports both real and mock data"""
+    validate_geo_filters(filters)
+    is_geo_query = filters.radius_miles is not None or has_bbox(filters)
     
     # Check if this is an Atlanta-area zip code
     atlanta_zip_codes = ["30309", "30308", "30305", "30312", "30313", "30314", "30315", "30316", "30317"]
     
     if filters.zip_code and filters.zip_code in atlanta_zip_codes:
         try:
-            # Import the service here to avoid import issues
-            from fulton_county_service import get_fulton_county_properties
-            
             # Fetch real Fulton County data
             properties = await get_fulton_county_properties(filters.zip_code)
             
             if properties:
-                # Apply additional filters to real data
-                if filters.situation_types:
-                    properties = [p for p in properties if p["situation_type"] in filters.situation_types]
-                
-                if filters.min_equity is not None:
-                    properties = [p for p in properties if p["equity_percentage"] >= filters.min_equity]
-                    
-                if filters.max_equity is not None:
-                    properties = [p for p in properties if p["equity_percentage"] <= filters.max_equity]
-                
-                if filters.min_value is not None:
-                    properties = [p for p in properties if p["estimated_value"] >= filters.min_value]
-                    
-                if filters.max_value is not None:
-                    properties = [p for p in properties if p["estimated_value"] <= filters.max_value]
-                
-                if filters.min_motivation is not None:
-                    properties = [p for p in properties if p["motivation_score"] >= filters.min_motivation]
-                
-                # Sort by motivation score (highest first)
-                properties.sort(key=lambda x: x["motivation_score"], reverse=True)
-                
-                # Cache the properties for message generation
+                # Cache (and index) everything fetched for message generation and geo queries
                 cache_properties(properties)
-                return properties
+                LOADED_ZIPS.add(filters.zip_code)
+                
+                if not is_geo_query:
+                    return apply_filters(properties, filters)
             
         except Exception as e:
             print(f"Error fetching real data, falling back to mock: {e}")
     
+    if is_geo_query:
+        # Geo queries run against the spatial index; Atlanta zips in range load in the background
+        loading = load_zips_in_area(filters)
+        if loading:
+            response.headers["X-Loading-Zips"] = ",".join(loading)
+        properties = geo_search(filters)
+        if filters.zip_code:
+            properties = [p for p in properties if p["zip_code"] == filters.zip_code]
+        return apply_filters(properties, filters)
+    
     # Fallback to mock data for non-Atlanta zip codes or errors
     properties = MOCK_PROPERTIES.copy()
     
@@ -266,30 +482,9 @@ async def search_properties(filters: PropertyFilter) -> List[Property]:
     if filters.zip_code:
         properties = [p for p in properties if p["zip_code"] == filters.zip_code]
     
-    if filters.situation_types:
-        properties = [p for p in properties if p["situation_type"] in filters.situation_types]
-    
-    if filters.min_equity is not None:
-        properties = [p for p in properties if p["equity_percentage"] >= filters.min_equity]
-        
-    if filters.max_equity is not None:
-        properties = [p for p in properties if p["equity_percentage"] <= filters.max_equity]
-    
-    if filters.min_value is not None:
-        properties = [p for p in properties if p["estimated_value"] >= filters.min_value]
-        
-    if filters.max_value is not None:
-        properties = [p for p in properties if p["estimated_value"] <= filters.max_value]
-    
-    if filters.min_motivation is not None:
-        properties = [p for p in properties if p["motivation_score"] >= filters.min_motivation]
-    
-    # Sort by motivation score (highest first)
-    properties.sort(key=lambda x: x["motivation_score"], reverse=True)
-    
     # Cache the mock properties too
     cache_properties(properties)
-    return properties
+    return apply_filters(properties, filters)
 
 @app.get("/api/properties/{property_id}")
 async def get_property(property_id: int) -> Property:
@@ -299,6 +494,25 @@ async def get_property(property_id: int) -> Property:
         raise HTTPException(status_code=404, detail="Property not found")
     return property_data
 
+@app.get("/api/owners/portfolio")
+async def get_owner_portfolio(owner_name: str) -> OwnerPortfolio:
+    """Get every known parcel held by an owner, correcting a one-letter typo in the name"""
+    portfolio = OWNER_INDEX.portfolio(owner_name)
+    if not portfolio:
+        raise HTTPException(status_code=404, detail="Owner not found")
+    
+    properties = [get_cached_property(pid) for pid in portfolio["parcel_ids"]]
+    properties = [p for p in properties if p]
+    
+    return {
+        "owner_id": portfolio["owner_id"],
+        "owner_name": portfolio["owner_name"],
+        "aliases": portfolio["aliases"],
+        "exact_match": portfolio["exact_match"],
+        "portfolio_size": len(properties),
+        "properties": properties
+    }
+
 @app.post("/api/generate-message")
 async def generate_message(request: MessageRequest):
     """Generate AI-powered initial contact message"""
@@ -369,7 +583,7 @@ async def generate_message(request: MessageRequest):
     """
     
     try:
-        response = client.messages.create(
+        response = get_client().messages.create(
             model="claude-3-5-haiku-20241022",
             max_tokens=200,
             temperature=0.7,
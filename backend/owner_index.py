@@ -0,0 +1,242 @@
+import re
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+# Entity types, so "John Smith LLC" and "John Smith Trust" resolve together
+ENTITY_TOKENS = {"LLC", "INC", "CORP", "CO", "LTD", "LP", "LLP", "TRUST", "TR", "TRUSTEE", "ESTATE"}
+
+# Tokens that don't identify an owner: titles, generational suffixes, fillers
+NOISE_TOKENS = {"THE", "MR", "MRS", "MS", "DR", "JR", "SR", "II", "III", "IV", "ETAL", "ET", "AL", "OF", "AND"}
+
+def _meaningful(text: str) -> List[str]:
+    """Tokens of a raw name that identify the owner"""
+    tokens = re.sub(r"[^A-Z0-9 ]", " ", text.upper()).split()
+    return [t for t in tokens if t not in NOISE_TOKENS and t not in ENTITY_TOKENS]
+
+def normalize_owner_name(name: str) -> str:
+    """Canonical owner key: uppercase, first name first, no punctuation/noise"""
+    name = name.upper().replace("&", " AND ")
+    # Deed records write "SMITH, JOHN A"; put the given names first. A comma
+    # before only an entity type ("SMITH HOLDINGS, LLC") is not a name swap.
+    last, comma, rest = name.partition(",")
+    if comma and _meaningful(rest.split(",")[0]):
+        name = f"{rest} {last}"
+
+    tokens = re.sub(r"[^A-Z0-9 ]", " ", name).split()
+    meaningful = _meaningful(name)
+
+    # Single letters are middle initials only in personal names ("John A Smith");
+    # in entities like "J & M Properties LLC" they are the identifying part
+    words = [t for t in meaningful if len(t) > 1]
+    if not ENTITY_TOKENS.intersection(tokens) and len(words) >= 2:
+        meaningful = words
+
+    # Never reduce a name to nothing
+    return " ".join(meaningful or tokens)
+
+def within_one_edit(a: str, b: str) -> bool:
+    """True if a and b differ by at most one insert, delete or substitution"""
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > 1:
+        return False
+
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+def _cuts(length: int) -> Tuple[int, int, int, int]:
+    """Boundaries splitting a key of this length into three segments"""
+    return 0, length // 3, 2 * length // 3, length
+
+def _segments(key: str) -> List[int]:
+    """Hashes of a key's three segments, tagged with key length and position.
+
+    Only hashes are kept to save memory; a collision just adds a candidate
+    that fails the edit-distance check.
+    """
+    cuts = _cuts(len(key))
+    return [hash((len(key), j, key[cuts[j]:cuts[j + 1]])) for j in range(3)]
+
+class OwnerIndex:
+    """Resolves owner names to owner entities and tracks their parcels.
+
+    Parcels are grouped under an owner only when their names normalize to
+    the same key; a one-letter difference can be a different person ("Mary
+    Johnson" / "Mary Johnston"), so typos never merge owners at ingest.
+
+    Lookups also accept a name one typo away from a known owner. Each key
+    is split into three segments and one edit can only touch one of them,
+    so a match shares at least two intact segments with the query. Owners
+    are indexed under their three segment hashes, and a lookup intersects
+    the buckets of its own segments (at the three possible lengths and the
+    one-character shifts an insert or delete causes) instead of scanning
+    every owner.
+    """
+
+    def __init__(self, min_fuzzy_length: int = 10):
+        # Short names are too easily one edit apart ("JOHN LEE" / "JOHN LEO")
+        self.min_fuzzy_length = min_fuzzy_length
+        self._owners: Dict[int, Dict] = {}
+        self._by_key: Dict[str, int] = {}
+        # Segment hash -> owner id, or a set of ids once the segment is shared
+        self._segments: Dict[int, Union[int, Set[int]]] = {}
+        self._parcel_owner: Dict[int, int] = {}
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def _fuzzy(self, key: str) -> bool:
+        """Whether a key may match by typo; letters and numbers in codes must match exactly"""
+        if len(key) < self.min_fuzzy_length or any(c.isdigit() for c in key):
+            return False
+        # "J M PROPERTIES" and "A M PROPERTIES" are different entities
+        return all(len(token) > 1 for token in key.split())
+
+    def _bucket(self, segment: int) -> Set[int]:
+        owners = self._segments.get(segment)
+        if owners is None:
+            return set()
+        return {owners} if isinstance(owners, int) else owners
+
+    def _match(self, key: str) -> Optional[int]:
+        """Find a known owner one edit away from this key"""
+        if not self._fuzzy(key):
+            return None
+
+        candidates = set()
+        for length in (len(key) - 1, len(key), len(key) + 1):
+            cuts = _cuts(length)
+            # An insert or delete before a segment shifts it by one character
+            shifts = {0, len(key) - length}
+            buckets = [
+                [
+                    self._bucket(hash((length, j, key[cuts[j] + shift:cuts[j + 1] + shift])))
+                    for shift in shifts
+                    if 0 <= cuts[j] + shift and cuts[j + 1] + shift <= len(key)
+                ]
+                for j in range(3)
+            ]
+            # Owners sharing at least two segments with the query
+            for j, k in ((0, 1), (0, 2), (1, 2)):
+                for a in buckets[j]:
+                    for b in buckets[k]:
+                        candidates.update(a & b)
+
+        # Lowest id wins so repeated lookups resolve to the same owner
+        for owner_id in sorted(candidates):
+            if within_one_edit(key, self._owners[owner_id]["key"]):
+                return owner_id
+        return None
+
+    def resolve(self, owner_name: str) -> Optional[int]:
+        """Get the owner id for a name, or None if no known owner matches"""
+        key = normalize_owner_name(owner_name)
+        if not key:
+            return None
+        if key in self._by_key:
+            return self._by_key[key]
+        return self._match(key)
+
+    def _create_owner(self, key: str, owner_name: str) -> int:
+        owner_id = self._next_id
+        self._next_id += 1
+        self._owners[owner_id] = {
+            "owner_name": owner_name,
+            "key": key,
+            "parcels": set()
+        }
+        self._by_key[key] = owner_id
+        if self._fuzzy(key):
+            for segment in _segments(key):
+                owners = self._segments.get(segment)
+                if owners is None:
+                    self._segments[segment] = owner_id
+                elif isinstance(owners, int):
+                    self._segments[segment] = {owners, owner_id}
+                else:
+                    owners.add(owner_id)
+        return owner_id
+
+    def _drop_owner(self, owner_id: int):
+        owner = self._owners.pop(owner_id)
+        del self._by_key[owner["key"]]
+        if self._fuzzy(owner["key"]):
+            for segment in _segments(owner["key"]):
+                owners = self._segments[segment]
+                if isinstance(owners, int):
+                    del self._segments[segment]
+                    continue
+                owners.discard(owner_id)
+                if len(owners) == 1:
+                    self._segments[segment] = owners.pop()
+
+    def add(self, prop: Dict) -> Optional[int]:
+        """Index a property's owner, moving the parcel if its owner changed"""
+        key = normalize_owner_name(prop.get("owner_name") or "")
+        if not key:
+            # Blank owners are unknown, not one shared owner
+            self.remove(prop["id"])
+            return None
+
+        owner_id = self._by_key.get(key)
+        if owner_id is None:
+            owner_id = self._create_owner(key, prop["owner_name"])
+        elif prop["owner_name"] != self._owners[owner_id]["owner_name"]:
+            # Same owner written differently ("SMITH, JOHN", "John Smith LLC")
+            # Most owners have one spelling; only allocate aliases when needed
+            self._owners[owner_id].setdefault("aliases", set()).add(prop["owner_name"])
+
+        previous = self._parcel_owner.get(prop["id"])
+        if previous is not None and previous != owner_id:
+            self.remove(prop["id"])
+
+        self._owners[owner_id]["parcels"].add(prop["id"])
+        self._parcel_owner[prop["id"]] = owner_id
+        return owner_id
+
+    def remove(self, property_id: int):
+        """Detach a parcel from its owner, dropping owners left with no parcels"""
+        owner_id = self._parcel_owner.pop(property_id, None)
+        if owner_id is None:
+            return
+        parcels = self._owners[owner_id]["parcels"]
+        parcels.discard(property_id)
+        if not parcels:
+            self._drop_owner(owner_id)
+
+    def portfolio(self, owner_name: str) -> Optional[Dict]:
+        """Get the owner entity and parcel ids for a name, or the owner one typo away.
+
+        Only the single best owner is returned; owners one edit apart from
+        each other stay separate portfolios. `exact_match` tells callers
+        whether the name had to be corrected.
+        """
+        owner_id = self.resolve(owner_name)
+        if owner_id is None:
+            return None
+        owner = self._owners[owner_id]
+        return {
+            "owner_id": owner_id,
+            "owner_name": owner["owner_name"],
+            "aliases": sorted(owner.get("aliases", ())),
+            "exact_match": normalize_owner_name(owner_name) == owner["key"],
+            "parcel_ids": sorted(owner["parcels"])
+        }
+
+    def owner_parcels(self, property_id: int) -> List[int]:
+        """Parcel ids held by the same owner as a property (empty if not indexed)"""
+        owner_id = self._parcel_owner.get(property_id)
+        if owner_id is None:
+            return []
+        return sorted(self._owners[owner_id]["parcels"])
+
+    def portfolio_size(self, property_id: int) -> int:
+        """Number of parcels held by a property's owner (0 if not indexed)"""
+        owner_id = self._parcel_owner.get(property_id)
+        if owner_id is None:
+            return 0
+        return len(self._owners[owner_id]["parcels"])
@@ -0,0 +1,108 @@
+"""Cold start profiling for the backend.
+
+Usage:
+    python startup_profile.py                  # per-module import cost report
+    python startup_profile.py --budget-ms 3000 # also check time-to-first-response
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent
+
+# Default time-to-first-response budget for a cold process, in milliseconds
+DEFAULT_BUDGET_MS = int(os.getenv("STARTUP_BUDGET_MS", "3000"))
+
+def import_time_report(module: str = "main", top: int = 15) -> List[Dict]:
+    """Import a module in a fresh interpreter and return its costliest direct imports"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}: {result.stderr.strip().splitlines()[-1]}")
+
+    # Children are printed before their parent and indented two spaces per level
+    report, pending = [], []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        entry = {
+            "module": name.strip(),
+            "self_ms": int(self_us.strip()) / 1000,
+            "cumulative_ms": int(cumulative_us.strip()) / 1000,
+        }
+        if depth == 1:
+            pending.append(entry)
+        elif depth == 0:
+            # Keep the target and its direct imports, drop interpreter startup modules
+            if entry["module"] == module:
+                report.extend(pending + [entry])
+            pending = []
+
+    report.sort(key=lambda x: x["cumulative_ms"], reverse=True)
+    return report[:top]
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def time_to_first_response(timeout: float = 30.0) -> float:
+    """Start a fresh server and return milliseconds until `GET /` answers"""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if server.poll() is not None:
+                raise RuntimeError("Server exited before answering")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - start) * 1000
+            except OSError:
+                time.sleep(0.02)
+        raise TimeoutError(f"No response from {url} within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile backend cold start")
+    parser.add_argument("--module", default="main", help="Module to profile imports for")
+    parser.add_argument("--top", type=int, default=15, help="Number of imports to show")
+    parser.add_argument("--budget-ms", type=int, nargs="?", const=DEFAULT_BUDGET_MS,
+                        help="Fail if time-to-first-response exceeds this budget")
+    args = parser.parse_args()
+
+    print(f"Import cost for '{args.module}' (cumulative / self, ms):")
+    for entry in import_time_report(args.module, args.top):
+        print(f"  {entry['cumulative_ms']:8.1f} / {entry['self_ms']:7.1f}  {entry['module']}")
+
+    if args.budget_ms is not None:
+        elapsed = time_to_first_response()
+        status = "OK" if elapsed <= args.budget_ms else "OVER BUDGET"
+        print(f"Time to first response: {elapsed:.0f} ms (budget {args.budget_ms} ms) {status}")
+        if elapsed > args.budget_ms:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
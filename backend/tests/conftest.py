@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+# Backend modules are imported as top-level modules, as uvicorn does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+@pytest.fixture
+def app_state(monkeypatch):
+    """Fresh caches and indexes in main, seeded with the mock properties like at import"""
+    import main
+    from geo_index import GeoIndex
+    from owner_index import OwnerIndex
+
+    monkeypatch.setattr(main, "PROPERTY_CACHE", {})
+    monkeypatch.setattr(main, "GEO_INDEX", GeoIndex())
+    monkeypatch.setattr(main, "OWNER_INDEX", OwnerIndex())
+    monkeypatch.setattr(main, "LOADED_ZIPS", set())
+    monkeypatch.setattr(main, "LOADING_ZIPS", {})
+    for prop in main.MOCK_PROPERTIES:
+        main.GEO_INDEX.add(prop)
+        main.OWNER_INDEX.add(prop)
+    return main
@@ -0,0 +1,56 @@
+import random
+
+from geo_index import GeoIndex, haversine_miles
+
+def make_index(count=5000, seed=7):
+    rng = random.Random(seed)
+    props = [
+        {"id": i, "latitude": 33.6 + rng.random() * 0.4, "longitude": -84.6 + rng.random() * 0.4}
+        for i in range(count)
+    ]
+    index = GeoIndex()
+    for prop in props:
+        index.add(prop)
+    return index, props
+
+def test_within_radius_matches_brute_force():
+    index, props = make_index()
+    rng = random.Random(1)
+    for _ in range(50):
+        lat, lon = 33.6 + rng.random() * 0.4, -84.6 + rng.random() * 0.4
+        radius = rng.uniform(0.1, 8)
+        expected = {p["id"] for p in props if haversine_miles(lat, lon, p["latitude"], p["longitude"]) <= radius}
+        found = index.within_radius(lat, lon, radius)
+        assert {p["id"] for p, _ in found} == expected
+        for prop, distance in found:
+            assert distance == haversine_miles(lat, lon, prop["latitude"], prop["longitude"])
+
+def test_within_bbox_matches_brute_force():
+    index, props = make_index()
+    rng = random.Random(2)
+    for _ in range(50):
+        lat1, lat2 = sorted(33.5 + rng.random() * 0.6 for _ in range(2))
+        lon1, lon2 = sorted(-84.7 + rng.random() * 0.6 for _ in range(2))
+        expected = {
+            p["id"] for p in props
+            if lat1 <= p["latitude"] <= lat2 and lon1 <= p["longitude"] <= lon2
+        }
+        assert {p["id"] for p in index.within_bbox(lat1, lon1, lat2, lon2)} == expected
+
+def test_points_on_cell_edges_are_found():
+    index = GeoIndex(cell_size_deg=0.02)
+    index.add({"id": 1, "latitude": 0.04, "longitude": -0.02})
+    assert [p["id"] for p in index.within_bbox(0.04, -0.02, 0.04, -0.02)] == [1]
+    assert [p["id"] for p, _ in index.within_radius(0.04, -0.02, 0.01)] == [1]
+
+def test_add_moves_and_remove_drops():
+    index = GeoIndex()
+    index.add({"id": 1, "latitude": 33.75, "longitude": -84.39})
+    index.add({"id": 1, "latitude": 40.75, "longitude": -73.99})
+    assert len(index) == 1
+    assert index.within_radius(33.75, -84.39, 1) == []
+    assert [p["id"] for p, _ in index.within_radius(40.75, -73.99, 1)] == [1]
+
+    index.add({"id": 1, "latitude": None, "longitude": None})
+    assert len(index) == 0
+    index.remove(1)
@@ -0,0 +1,154 @@
+import random
+import string
+import time
+
+import pytest
+
+from owner_index import OwnerIndex, normalize_owner_name, within_one_edit
+
+def one_edit_variants(key, alphabet=string.ascii_uppercase + " "):
+    for i in range(len(key) + 1):
+        for c in alphabet:
+            yield key[:i] + c + key[i:]
+            if i < len(key):
+                yield key[:i] + c + key[i + 1:]
+        if i < len(key):
+            yield key[:i] + key[i + 1:]
+
+def test_every_one_edit_variant_is_matched():
+    index = OwnerIndex()
+    index.add({"id": 1, "owner_name": "Patricia Robinson"})
+    key = normalize_owner_name("Patricia Robinson")
+    for variant in one_edit_variants(key):
+        if index._fuzzy(variant):
+            assert index._match(variant) == 1, variant
+
+def test_two_edits_are_not_matched():
+    index = OwnerIndex()
+    index.add({"id": 1, "owner_name": "Patricia Robinson"})
+    assert index.resolve("Patricia Robinsenn") is None
+    assert index.resolve("Patrica Robinsin") is None
+
+def test_within_one_edit_matches_brute_force():
+    rng = random.Random(3)
+    for _ in range(2000):
+        a = "".join(rng.choices("AB ", k=rng.randint(0, 6)))
+        b = "".join(rng.choices("AB ", k=rng.randint(0, 6)))
+        expected = a == b or b in set(one_edit_variants(a, "AB "))
+        assert within_one_edit(a, b) == expected, (a, b)
+
+@pytest.mark.parametrize("name, key", [
+    ("John A. Smith", "JOHN SMITH"),
+    ("Smith, John A", "JOHN SMITH"),
+    ("SMITH, JOHN JR", "JOHN SMITH"),
+    ("Smith Holdings, LLC", "SMITH HOLDINGS"),
+    ("Thomas Williams", "THOMAS WILLIAMS"),
+    ("John Smith LLC", "JOHN SMITH"),
+    ("J & M Properties LLC", "J M PROPERTIES"),
+    ("A & B Properties", "A B PROPERTIES"),
+    ("", ""),
+])
+def test_normalize_owner_name(name, key):
+    assert normalize_owner_name(name) == key
+
+def test_single_letter_entities_stay_separate():
+    index = OwnerIndex()
+    index.add({"id": 1, "owner_name": "J & M Properties LLC"})
+    index.add({"id": 2, "owner_name": "A & M Properties LLC"})
+    index.add({"id": 3, "owner_name": "A & B Properties"})
+    assert len(index) == 3
+    assert index.portfolio("J&M Properties")["parcel_ids"] == [1]
+
+def test_blank_owners_are_not_indexed():
+    index = OwnerIndex()
+    index.add({"id": 1, "owner_name": ""})
+    index.add({"id": 2, "owner_name": "  "})
+    assert len(index) == 0
+    assert index.portfolio("") is None
+    assert index.portfolio_size(1) == 0
+
+def test_spellings_of_one_owner_share_a_portfolio():
+    index = OwnerIndex()
+    for i, name in enumerate(["John Smithson", "SMITHSON, JOHN", "John Smithson LLC", "Jon Smithson"]):
+        index.add({"id": i, "owner_name": name})
+    portfolio = index.portfolio("john smithson")
+    assert portfolio["parcel_ids"] == [0, 1, 2]
+    assert portfolio["aliases"] == ["John Smithson LLC", "SMITHSON, JOHN"]
+    assert portfolio["exact_match"]
+    assert index.portfolio_size(3) == 1
+
+@pytest.mark.parametrize("a, b", [
+    ("Mary Johnson", "Mary Johnston"),
+    ("James Brown", "James Browne"),
+    ("Carl Anderson", "Carl Andersen"),
+    ("Dana Wilson", "Dan Wilson"),
+    ("Smith Holdings LLC", "Smith Holding LLC"),
+    ("William Thomas", "Thomas Williams"),
+    ("David Thomas", "Thomas Davis"),
+])
+def test_similar_names_stay_separate_owners(a, b):
+    index = OwnerIndex()
+    index.add({"id": 1, "owner_name": a})
+    index.add({"id": 2, "owner_name": b})
+    assert len(index) == 2
+    assert index.portfolio(a)["parcel_ids"] == [1]
+    assert index.portfolio(b)["parcel_ids"] == [2]
+
+def test_lookup_corrects_typos():
+    index = OwnerIndex()
+    index.add({"id": 1, "owner_name": "Jennifer Castellano"})
+    portfolio = index.portfolio("Jennifer Castelano")
+    assert portfolio["parcel_ids"] == [1]
+    assert not portfolio["exact_match"]
+    # The lookup doesn't register the typo as a spelling of the owner
+    assert index.resolve("Jennifer Castelano") == 1 and len(index._by_key) == 1
+
+def test_parcel_moves_between_owners():
+    index = OwnerIndex()
+    index.add({"id": 1, "owner_name": "Mary Johnson"})
+    index.add({"id": 2, "owner_name": "Mary Johnson"})
+    index.add({"id": 2, "owner_name": "David Williams"})
+    assert index.owner_parcels(1) == [1]
+    assert index.owner_parcels(2) == [2]
+    # Re-adding the same owner is a no-op
+    index.add({"id": 2, "owner_name": "David Williams"})
+    assert index.portfolio_size(2) == 1
+
+def test_owner_dropped_with_last_parcel():
+    index = OwnerIndex()
+    index.add({"id": 1, "owner_name": "Elizabeth Thompson"})
+    index.add({"id": 1, "owner_name": "Barbara Martinez"})
+    assert len(index) == 1
+    assert index.resolve("Elizabeth Thompson") is None
+    assert index.resolve("Elizabeth Thompsen") is None
+
+    index.remove(1)
+    assert len(index) == 0
+    assert index._segments == {} and index._by_key == {}
+    index.remove(1)
+
+def test_index_scales_with_common_first_names():
+    # Many owners share a first name, so the first segment's bucket is huge
+    rng = random.Random(5)
+    first_names = ["JAMES", "MARY", "JOHN", "PATRICIA", "ROBERT", "JENNIFER"]
+    names = [
+        f"{rng.choice(first_names)} {''.join(rng.choices(string.ascii_uppercase, k=rng.randint(5, 9)))}"
+        for _ in range(50000)
+    ]
+    index = OwnerIndex()
+    start = time.perf_counter()
+    for i, name in enumerate(names):
+        index.add({"id": i, "owner_name": name})
+    assert time.perf_counter() - start < 10
+
+    # Three entries per owner at most, and shared segments are rare
+    assert len(index._segments) <= 3 * len(index)
+    shared = [owners for owners in index._segments.values() if isinstance(owners, set)]
+    assert len(shared) < len(index) // 10
+
+    start = time.perf_counter()
+    for name in names[:1000]:
+        typo = name[:-1] + ("Q" if name[-1] != "Q" else "R")
+        owner_id = index.resolve(typo)
+        assert within_one_edit(typo, index._owners[owner_id]["key"])
+    assert time.perf_counter() - start < 5
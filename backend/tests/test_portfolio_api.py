@@ -0,0 +1,66 @@
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from fulton_county_service import FultonCountyPropertyService
+
+@pytest.fixture
+def client(app_state):
+    with TestClient(main.app) as client:
+        yield client
+
+def generated_parcels(owner_name, count, seed=7):
+    """Parcels from the Fulton County generator, all held by one owner"""
+    random.seed(seed)
+    service = FultonCountyPropertyService()
+    parcels = []
+    for i in range(count):
+        prop = service._generate_realistic_property_data(f"{100 + i} PEACHTREE ST NW", "30309")
+        parcels.append({**prop, "id": 90000 + i, "owner_name": owner_name})
+    return parcels
+
+def test_portfolio_not_found(client):
+    response = client.get("/api/owners/portfolio", params={"owner_name": "Nobody Atall"})
+    assert response.status_code == 404
+
+def test_portfolio_groups_spellings_and_corrects_typos(client):
+    props = generated_parcels("Jennifer Castellano", 3)
+    props[1]["owner_name"] = "CASTELLANO, JENNIFER"
+    props[2]["owner_name"] = "Jennifer Castellano LLC"
+    main.cache_properties(props)
+
+    response = client.get("/api/owners/portfolio", params={"owner_name": "jennifer castelano"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["portfolio_size"] == 3
+    assert body["aliases"] == ["CASTELLANO, JENNIFER", "Jennifer Castellano LLC"]
+    assert not body["exact_match"]
+    assert {p["id"] for p in body["properties"]} == {90000, 90001, 90002}
+    # Only public Property fields are returned
+    assert "signals" not in body["properties"][0] and "data_source" not in body["properties"][0]
+
+def test_typo_does_not_merge_owners(client):
+    props = generated_parcels("Mary Johnson", 3)
+    props[2]["owner_name"] = "Mary Johnston"
+    main.cache_properties(props)
+
+    for name, size in [("Mary Johnson", 2), ("Mary Johnston", 1)]:
+        body = client.get("/api/owners/portfolio", params={"owner_name": name}).json()
+        assert body["portfolio_size"] == size and body["exact_match"]
+
+def test_large_portfolio_scores_as_tired_landlord(client):
+    props = generated_parcels("Richard Okonkwo", 12)
+    signals = [prop["signals"] for prop in props]
+    overriding = [s.get("tax_delinquent_years", 0) > 1 or "estate_sale" in s for s in signals]
+    assert not all(overriding)
+
+    main.cache_properties(props[:2])
+    assert "tired_landlord" not in {p["situation_type"] for p in props[:2]}
+
+    # The third parcel pushes the owner over the threshold, rescoring all of them
+    main.cache_properties(props[2:])
+    for prop, overridden in zip(props, overriding):
+        assert prop["portfolio_size"] == 12
+        assert (prop["situation_type"] == "tired_landlord") != overridden
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from fulton_county_service import FultonCountyPropertyService
+
+async def fake_fetch(zip_code):
+    # Skip the polite per-property delay of the real fetch
+    service = FultonCountyPropertyService()
+    return [
+        service._generate_realistic_property_data(address, zip_code)
+        for address in service._get_test_addresses_by_zip(zip_code)
+    ]
+
+@pytest.fixture
+def client(app_state, monkeypatch):
+    monkeypatch.setattr(main, "get_fulton_county_properties", fake_fetch)
+    with TestClient(main.app) as client:
+        yield client
+
+def test_radius_search_sorted_by_distance(client):
+    response = client.post("/api/properties/search", json={
+        "latitude": 40.7484, "longitude": -73.9967, "radius_miles": 1, "sort_by": "distance"
+    })
+    assert response.status_code == 200
+    results = response.json()
+    assert {p["id"] for p in results} == {1, 2, 4}
+    distances = [p["distance_miles"] for p in results]
+    assert distances == sorted(distances) and distances[0] == 0
+
+def test_bbox_search_combines_with_filters(client):
+    response = client.post("/api/properties/search", json={
+        "min_latitude": 40.70, "max_latitude": 40.76,
+        "min_longitude": -74.01, "max_longitude": -73.98,
+        "min_motivation": 8
+    })
+    assert response.status_code == 200
+    results = response.json()
+    assert {p["id"] for p in results} == {1, 3, 5, 6}
+    scores = [p["motivation_score"] for p in results]
+    assert scores == sorted(scores, reverse=True)
+
+def test_radius_search_loads_atlanta_zips_in_background(client):
+    query = {"latitude": 33.7984, "longitude": -84.3883, "radius_miles": 1}
+    response = client.post("/api/properties/search", json=query)
+    assert response.status_code == 200
+    assert response.headers["X-Loading-Zips"] == "30309"
+
+    deadline = time.monotonic() + 5
+    while "30309" not in main.LOADED_ZIPS and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    response = client.post("/api/properties/search", json=query)
+    assert "X-Loading-Zips" not in response.headers
+    results = response.json()
+    assert results and all(p["distance_miles"] <= 1 for p in results)
+
+def test_zips_without_address_data_are_not_auto_loaded(client):
+    # 30316's centroid, far enough from zips that have known addresses
+    response = client.post("/api/properties/search", json={
+        "latitude": 33.7216, "longitude": -84.3339, "radius_miles": 1
+    })
+    assert response.json() == []
+    assert "X-Loading-Zips" not in response.headers
+
+def test_cold_geo_query_does_not_wait_for_real_fetch(app_state):
+    # Unpatched fetch sleeps a second per parcel; the query must not wait for it
+    with TestClient(main.app) as client:
+        start = time.perf_counter()
+        response = client.post("/api/properties/search", json={
+            "min_latitude": 33.70, "max_latitude": 33.85,
+            "min_longitude": -84.45, "max_longitude": -84.30
+        })
+        elapsed = time.perf_counter() - start
+    assert response.status_code == 200
+    assert elapsed < 0.5
+    assert set(response.headers["X-Loading-Zips"].split(",")) == {"30305", "30308", "30309", "30312"}
+
+@pytest.mark.parametrize("payload", [
+    {"latitude": 400, "longitude": -73.9, "radius_miles": 1},
+    {"latitude": 40.7, "longitude": -200, "radius_miles": 1},
+    {"latitude": 40.7, "longitude": -73.9, "radius_miles": 0},
+    {"latitude": 40.7, "longitude": -73.9, "sort_by": "price"},
+])
+def test_invalid_geo_values_rejected(client, payload):
+    assert client.post("/api/properties/search", json=payload).status_code == 422
+
+@pytest.mark.parametrize("payload", [
+    {"radius_miles": 1},
+    {"latitude": 40.7},
+    {"min_latitude": 40.7, "max_latitude": 40.8},
+    {"min_latitude": 40.8, "max_latitude": 40.7, "min_longitude": -74, "max_longitude": -73},
+    {"sort_by": "distance"},
+])
+def test_incomplete_geo_filters_rejected(client, payload):
+    assert client.post("/api/properties/search", json=payload).status_code == 400
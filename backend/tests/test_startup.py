@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+from startup_profile import BACKEND_DIR, DEFAULT_BUDGET_MS, time_to_first_response
+
+HEAVY_MODULES = ("anthropic", "requests", "bs4", "aiohttp")
+
+def test_time_to_first_response_within_budget():
+    assert time_to_first_response() <= DEFAULT_BUDGET_MS
+
+def test_main_does_not_import_heavy_clients():
+    # Check sys.modules so heavy imports are caught at any depth, not just in main
+    result = subprocess.run(
+        [sys.executable, "-c", f"import main, sys; print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"